@@ -8,7 +8,7 @@ import signal
 import sys
 from pathlib import Path
 
-from whisper.config import Config
+from whisper.config import get_config
 from whisper.voice_keyboard import VoiceKeyboard
 
 
@@ -59,7 +59,7 @@ Prerequisites:
     
     # Load configuration
     config_path = Path(args.config) if args.config else None
-    config = Config(config_path)
+    config = get_config(config_path)
     
     # Create voice keyboard
     voice_keyboard = VoiceKeyboard(
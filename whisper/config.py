@@ -2,12 +2,34 @@
 Configuration management for whisper v2
 """
 
+import json
 import logging
+import os
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Set, Union
 
 import yaml
 
+# Prefer the LibYAML-backed loader when available
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Prefer orjson for the JSON config cache when available
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +43,8 @@ DEFAULT_CONFIG = {
     "keyboard": {
         "typing_delay_ms": 20,
         "key_hold_ms": 20,
+        "hotkey_delay_ms": 10,
+        "fast_mode": False,
         "discard_phrases": [
             "thank you",
             "thanks",
@@ -60,6 +84,50 @@ DEFAULT_CONFIG = {
     },
 }
 
+# Sections whose string settings may be null to disable them
+# (e.g. a shortcut, or a default word mapping)
+_NULLABLE_SECTIONS = ("shortcuts.", "word_mappings.")
+
+
+def _type_matches(value: Any, default: Any, nullable: bool = False) -> bool:
+    """
+    Check whether a configured value has the same kind of type as its default
+    
+    Args:
+        value: Configured value
+        default: Default value from DEFAULT_CONFIG
+        nullable: Whether None is accepted for a string setting
+        
+    Returns:
+        True if the value can be used in place of the default
+    """
+    if isinstance(default, bool):
+        return isinstance(value, bool)
+    if isinstance(default, (int, float)):
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if isinstance(default, str):
+        return isinstance(value, str) or (nullable and value is None)
+    return isinstance(value, type(default))
+
+
+def _freeze(value: Any) -> Any:
+    """Build a deep read-only copy of a config value (dicts -> mapping proxies, lists -> tuples)"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Read-only defaults returned when no user config applies; nested sections
+# are frozen too, so nothing handed out aliases DEFAULT_CONFIG
+_DEFAULT_RO = _freeze(DEFAULT_CONFIG)
+
+
+def _default_config_path() -> Path:
+    """Get the default config.yaml path in the workspace root (where this package is located)"""
+    return Path(__file__).parent.parent / "config.yaml"
+
 
 class Config:
     """Configuration manager for whisper v2"""
@@ -72,50 +140,197 @@ class Config:
             config_path: Path to config file. If None, uses config.yaml in workspace root
         """
         if config_path is None:
-            # Get workspace root (where this package is located)
-            pkg_dir = Path(__file__).parent
-            workspace_root = pkg_dir.parent
-            config_path = workspace_root / "config.yaml"
+            config_path = _default_config_path()
         
         self.config_path = config_path
-        self.config = self._load_config()
+        # Parsed YAML is cached as JSON next to the config file
+        self._cache_path = config_path.with_name(config_path.name + ".json")
+        
+        # Loaded lazily on first access (see _ensure_loaded)
+        self._config: Optional[Mapping[str, Any]] = None
         
+        # Flattened dot-notation view of the config for O(1) lookups
+        self._flat: Optional[Dict[str, Any]] = None
+    
+    @property
+    def config(self) -> Mapping[str, Any]:
+        """Get the merged configuration dictionary"""
+        if self._config is None:
+            self._ensure_loaded()
+        return self._config
+    
+    def _ensure_loaded(self):
+        """Load and flatten the configuration file"""
+        self._config = self._load_config()
+        self._flat = self._flatten(self._config)
         logger.info(f"Configuration loaded from {self.config_path}")
     
-    def _load_config(self) -> Dict[str, Any]:
+    def _load_config(self) -> Mapping[str, Any]:
         """Load configuration from file or use defaults"""
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    user_config = yaml.safe_load(f)
+        try:
+            # Single stat serves as both the existence check and the cache key
+            stat = os.stat(self.config_path)
+            user_config = self._read_cache(stat)
+            
+            if user_config is None:
+                with open(self.config_path, 'rb') as f:
+                    data = f.read()
+                user_config = yaml.load(data, Loader=_YamlLoader)
                 
                 if user_config is None:
                     user_config = {}
                 
-                config = self._deep_merge(DEFAULT_CONFIG.copy(), user_config)
-                logger.info(f"Loaded configuration from {self.config_path}")
-                return config
+                self._write_cache(stat, user_config)
             
-            except Exception as e:
-                logger.warning(f"Failed to load config from {self.config_path}: {e}")
-                logger.warning("Using default configuration")
-                return DEFAULT_CONFIG.copy()
-        else:
+            config = self._deep_merge(DEFAULT_CONFIG, user_config)
+            self._validate(config, DEFAULT_CONFIG)
+            logger.info(f"Loaded configuration from {self.config_path}")
+            return config
+        
+        except FileNotFoundError:
             logger.info(f"Config file not found at {self.config_path}, using defaults")
-            return DEFAULT_CONFIG.copy()
+            return _DEFAULT_RO
+        
+        except Exception as e:
+            logger.warning(f"Failed to load config from {self.config_path}: {e}")
+            logger.warning("Using default configuration")
+            return _DEFAULT_RO
+    
+    def _read_cache(self, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """
+        Read the parsed user config from the JSON cache
+        
+        Args:
+            stat: Result of stat() on the YAML config file
+            
+        Returns:
+            Cached user config, or None if the cache is missing or stale
+        """
+        try:
+            with open(self._cache_path, 'rb') as f:
+                cache = _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        
+        if (
+            not isinstance(cache, dict)
+            or cache.get("mtime_ns") != stat.st_mtime_ns
+            or cache.get("size") != stat.st_size
+        ):
+            return None
+        
+        logger.debug(f"Using cached configuration from {self._cache_path}")
+        return cache.get("config")
+    
+    def _write_cache(self, stat: os.stat_result, user_config: Dict[str, Any]):
+        """
+        Write the parsed user config to the JSON cache (best effort)
+        
+        Args:
+            stat: Result of stat() on the YAML config file
+            user_config: Parsed YAML contents
+        """
+        cache = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "config": user_config,
+        }
+        
+        try:
+            data = _json_dumps(cache)
+            
+            # Skip caching YAML that does not survive a JSON round-trip
+            # (non-string keys, dates, ...)
+            if _json_loads(data) != cache:
+                return
+            
+            tmp_path = self._cache_path.with_name(f"{self._cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write config cache {self._cache_path}: {e}")
     
     def _deep_merge(self, base: Dict, override: Dict) -> Dict:
-        """Deep merge two dictionaries"""
-        result = base.copy()
+        """
+        Deep merge two dictionaries into a new dictionary
         
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
+        Neither input is modified: every nested section of the result is a
+        fresh dict and lists from `base` are copied, so the merged config
+        never aliases `base`.
+        Nested sections are walked with an explicit stack, not recursion.
+        """
+        result = {}
+        stack = [(result, base, override)]
+        
+        while stack:
+            dst, src, over = stack.pop()
+            
+            for key, value in src.items():
+                if key in over:
+                    continue
+                if isinstance(value, dict):
+                    dst[key] = {}
+                    stack.append((dst[key], value, {}))
+                elif isinstance(value, list):
+                    dst[key] = list(value)
+                else:
+                    dst[key] = value
+            
+            for key, value in over.items():
+                src_value = src.get(key)
+                if isinstance(src_value, dict) and isinstance(value, dict):
+                    dst[key] = {}
+                    stack.append((dst[key], src_value, value))
+                else:
+                    dst[key] = value
         
         return result
     
+    def _validate(self, config: Dict, defaults: Mapping, prefix: str = ''):
+        """
+        Validate merged values against the types in DEFAULT_CONFIG
+        
+        Mismatched values are logged and replaced with their defaults, so
+        lookups can trust the shape of the config without runtime checks.
+        An empty section or list (YAML null) becomes an empty container,
+        e.g. `word_mappings:` turns all mappings off.
+        """
+        for key, default in defaults.items():
+            value = config.get(key)
+            path = f"{prefix}{key}"
+            
+            if value is None and isinstance(default, (dict, list)):
+                config[key] = type(default)()
+                continue
+            
+            if isinstance(default, dict):
+                if isinstance(value, dict):
+                    self._validate(value, default, f"{path}.")
+                    continue
+            elif _type_matches(value, default, path.startswith(_NULLABLE_SECTIONS)):
+                continue
+            
+            logger.warning(f"Invalid value for {path}: {value!r}, using default {default!r}")
+            config[key] = self._deep_merge({key: default}, {})[key]
+    
+    def _flatten(self, config: Mapping, prefix: str = '') -> Dict[str, Any]:
+        """
+        Flatten a nested dictionary into dot-notation keys
+        
+        Both sections and leaves are kept, so 'word_mappings' and
+        'keyboard.typing_delay_ms' resolve with a single lookup.
+        """
+        flat = {}
+        
+        for key, value in config.items():
+            path = f"{prefix}{key}"
+            flat[path] = value
+            if isinstance(value, Mapping):
+                flat.update(self._flatten(value, f"{path}."))
+        
+        return flat
+    
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get configuration value by dot-notation key
@@ -127,18 +342,11 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self.config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        if self._flat is None:
+            self._ensure_loaded()
+        return self._flat.get(key, default)
     
-    @property
+    @cached_property
     def socket_path(self) -> Path:
         """Get perception-voice socket path"""
         path_str = self.get('perception_voice.socket_path', 'perception.sock')
@@ -147,63 +355,99 @@ class Config:
             path = self.config_path.parent / path
         return path
     
-    @property
+    @cached_property
     def toggle_listening_shortcut(self) -> str:
         """Get toggle listening hotkey"""
         return self.get('shortcuts.toggle_listening', 'ctrl+shift+space')
     
-    @property
+    @cached_property
     def typing_delay_ms(self) -> int:
         """Get typing delay in milliseconds"""
         return self.get('keyboard.typing_delay_ms', 20)
     
-    @property
+    @cached_property
     def key_hold_ms(self) -> int:
         """Get key hold time in milliseconds"""
         return self.get('keyboard.key_hold_ms', 20)
     
-    @property
+    @cached_property
+    def hotkey_delay_ms(self) -> int:
+        """Get hotkey hold time in milliseconds"""
+        return self.get('keyboard.hotkey_delay_ms', 10)
+    
+    @cached_property
+    def fast_mode(self) -> bool:
+        """Check if fast typing mode (no typing delay or key hold) is enabled"""
+        return self.get('keyboard.fast_mode', False)
+    
+    @cached_property
     def discard_phrases(self) -> Set[str]:
         """Get phrases to discard"""
         phrases = self.get('keyboard.discard_phrases', [])
         return {p.lower().strip() for p in phrases}
     
-    @property
+    @cached_property
     def word_mappings(self) -> Dict[str, str]:
         """Get word to keystroke mappings"""
         return self.get('word_mappings', {})
     
-    @property
+    @cached_property
     def sounds_enabled(self) -> bool:
         """Check if sounds are enabled"""
         return self.get('sounds.enabled', True)
     
-    @property
+    @cached_property
     def sound_on_listening_start(self) -> str:
         """Get listening start sound file"""
         return self.get('sounds.on_listening_start', 'sfx/on.wav')
     
-    @property
+    @cached_property
     def sound_on_listening_stop(self) -> str:
         """Get listening stop sound file"""
         return self.get('sounds.on_listening_stop', 'sfx/off.wav')
     
-    @property
+    @cached_property
     def listening_state_delay_ms(self) -> int:
         """Get delay before state change takes effect"""
         return self.get('sounds.listening_state_delay_ms', 200)
     
-    @property
+    @cached_property
     def polling_interval_ms(self) -> int:
         """Get polling interval in milliseconds"""
         return self.get('polling.interval_ms', 100)
     
-    @property
+    @cached_property
     def timestamps_enabled(self) -> bool:
         """Check if timestamps are enabled in logging"""
         return self.get('logging.timestamps', True)
     
-    @property
+    @cached_property
     def verbose_logging(self) -> bool:
         """Check if verbose logging is enabled"""
         return self.get('logging.verbose', False)
+
+
+def get_config(config_path: Optional[Union[str, Path]] = None) -> Config:
+    """
+    Get the shared configuration instance
+    
+    Repeated calls for the same file return the same Config, so each file
+    is parsed at most once per process. Paths are resolved to absolute
+    form first, so None, the default path and any relative or str
+    spelling of the same file share one instance.
+    
+    Args:
+        config_path: Path to config file. If None, uses config.yaml in workspace root
+        
+    Returns:
+        Config instance
+    """
+    if config_path is None:
+        config_path = _default_config_path()
+    return _get_config(Path(config_path).resolve())
+
+
+@lru_cache(maxsize=None)
+def _get_config(config_path: Path) -> Config:
+    """Create the Config for a resolved path (cached per path)"""
+    return Config(config_path)
@@ -7,7 +7,8 @@ import queue
 import re
 import threading
 import time
-from typing import Dict, Optional, Set
+from functools import lru_cache
+from typing import Dict, Optional, Set, Tuple, Union
 
 from pynput.keyboard import Controller, Key
 
@@ -21,6 +22,110 @@ DEFAULT_DISCARD_PHRASES: Set[str] = {
     "you",
 }
 
+# Precompiled patterns for the transcription hot path
+_DISCARD_STRIP_CHARS = ' \t\n\r\f\v.,!?;:'
+_DISCARD_STRIP_RE = re.compile(r'^[\s\.,!?;:]+|[\s\.,!?;:]+$')
+
+# Hotkey names -> pynput keys (anything else is sent as a character)
+_KEY_MAP = {
+    'ctrl': Key.ctrl,
+    'control': Key.ctrl,
+    'shift': Key.shift,
+    'alt': Key.alt,
+    'cmd': Key.cmd,
+    'win': Key.cmd,
+    'super': Key.cmd,
+    'enter': Key.enter,
+    'tab': Key.tab,
+    'esc': Key.esc,
+    'escape': Key.esc,
+    'backspace': Key.backspace,
+    'delete': Key.delete,
+    'space': Key.space,
+}
+
+# Keyboard controller shared by all typers (created on first use)
+_controller: Optional[Controller] = None
+_controller_lock = threading.Lock()
+
+
+def _get_controller() -> Controller:
+    """Get the shared pynput keyboard controller, creating it once"""
+    global _controller
+    with _controller_lock:
+        if _controller is None:
+            _controller = Controller()
+        return _controller
+
+
+@lru_cache(maxsize=256)
+def _normalize_discard_text(text: str) -> str:
+    """
+    Normalize text for discard matching: lowercase, strip whitespace and punctuation
+    
+    Memoized because the same short misheard phrases recur constantly.
+    """
+    normalized = text.lower().strip(_DISCARD_STRIP_CHARS)
+    
+    # Non-ASCII whitespace is not in the strip set; fall back to the regex
+    if normalized and (normalized[0].isspace() or normalized[-1].isspace()):
+        normalized = _DISCARD_STRIP_RE.sub('', normalized)
+    
+    return normalized
+
+
+def _trie_pattern(words) -> str:
+    """
+    Build a regex alternation of words with shared prefixes factored out
+    
+    e.g. ["undo", "unset", "redo"] -> "(?:redo|un(?:do|set))"
+    
+    Continuing a word is always tried before ending it, so the longest
+    matching word wins, as with a longest-first flat alternation.
+    
+    Args:
+        words: Words to match (lowercase them first for case-insensitive use)
+        
+    Returns:
+        Regex source matching any of the words
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        if not word:
+            continue
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}  # end-of-word marker
+    
+    def node_pattern(node: Dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + node_pattern(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ''
+        
+        is_end = '' in node
+        if len(branches) == 1 and not is_end:
+            return branches[0]
+        
+        group = '(?:' + '|'.join(branches) + ')'
+        return group + '?' if is_end else group
+    
+    return node_pattern(trie)
+
+
+def _is_hotkey(replacement: Optional[str]) -> bool:
+    """Check if a word mapping replacement is a hotkey (e.g. ctrl+z)"""
+    return isinstance(replacement, str) and '+' in replacement and len(replacement) < 20
+
+
+def _parse_hotkey(hotkey_str: str) -> Tuple[Union[Key, str], ...]:
+    """Parse a hotkey string like "ctrl+shift+s" into pynput keys"""
+    return tuple(_KEY_MAP.get(key, key) for key in hotkey_str.lower().split('+'))
+
 
 class KeyboardTyper:
     """Types transcribed text using keyboard simulation with queued output"""
@@ -30,7 +135,9 @@ class KeyboardTyper:
         word_mappings: Optional[Dict[str, str]] = None,
         typing_delay_ms: int = 10,
         key_hold_ms: int = 20,
-        discard_phrases: Optional[Set[str]] = None
+        hotkey_delay_ms: int = 10,
+        discard_phrases: Optional[Set[str]] = None,
+        fast_mode: bool = False
     ):
         """
         Initialize keyboard typer
@@ -39,29 +146,70 @@ class KeyboardTyper:
             word_mappings: Dictionary mapping spoken words to keyboard inputs
             typing_delay_ms: Delay in milliseconds between each keystroke
             key_hold_ms: Delay in milliseconds between key press and release
+            hotkey_delay_ms: Time in milliseconds to hold a hotkey combination before release
             discard_phrases: Set of phrases to discard (case-insensitive)
+            fast_mode: Disable typing delay and key hold so text is typed in batches
         """
-        self.controller = Controller()
+        if fast_mode:
+            # Anti-skip pacing off: text runs go out in single controller.type() calls
+            typing_delay_ms = 0
+            key_hold_ms = 0
+        
+        self.controller = _get_controller()
         self.word_mappings = word_mappings or {}
         self.typing_delay_ms = typing_delay_ms
         self.typing_delay_s = typing_delay_ms / 1000.0
         self.key_hold_ms = key_hold_ms
         self.key_hold_s = key_hold_ms / 1000.0
+        self.hotkey_delay_ms = hotkey_delay_ms
+        self.hotkey_delay_s = hotkey_delay_ms / 1000.0
         
         # Discard filter: phrases that should not be typed
         if discard_phrases is None:
-            self.discard_phrases = DEFAULT_DISCARD_PHRASES
+            self.discard_phrases = frozenset(DEFAULT_DISCARD_PHRASES)
         else:
-            self.discard_phrases = {p.lower().strip() for p in discard_phrases}
+            self.discard_phrases = frozenset(p.lower().strip() for p in discard_phrases)
+        
+        # All word mappings compiled into one prefix-factored alternation (the
+        # longest phrase wins at any position), plus a case-insensitive lookup
+        # of each phrase's output item, resolved once (hotkey dict or text)
+        self._mapping_lookup = {
+            word.lower(): {'hotkey': repl} if _is_hotkey(repl) else repl
+            for word, repl in self.word_mappings.items()
+        }
+        self._mapping_re = re.compile(
+            r'\b(' + _trie_pattern(self._mapping_lookup) + r')\b[,.\s]*',
+            re.IGNORECASE
+        )
+        
+        # Prefilter: a character class of the phrases' first letters, matched
+        # with the same IGNORECASE rules as the alternation (so 'ſ' still
+        # finds 's', 'ς' finds 'σ', ...)
+        first_chars = sorted({word[0] for word in self._mapping_lookup if word})
+        self._mapping_first_re = re.compile(
+            '[' + ''.join(re.escape(char) for char in first_chars) + ']',
+            re.IGNORECASE
+        ) if first_chars else None
+        
+        # Hotkey replacements parsed once into pynput keys
+        self._hotkey_cache = {
+            repl: _parse_hotkey(repl)
+            for repl in self.word_mappings.values()
+            if _is_hotkey(repl)
+        }
         
-        # Output queue for serializing keyboard output
-        self._output_queue: queue.Queue = queue.Queue()
+        # Output queue for serializing keyboard output: (task type, args) tuples
+        # dispatched to their handlers by the worker thread
+        self._dispatch = {
+            "type_final": self._do_type_final,
+        }
+        self._output_queue: queue.SimpleQueue = queue.SimpleQueue()
         self._queue_worker_thread: Optional[threading.Thread] = None
         self._queue_running = False
         self._start_queue_worker()
         
-        logger.info(f"Keyboard typer initialized with {len(self.word_mappings)} mappings")
-        logger.info(f"Discard filter has {len(self.discard_phrases)} phrases")
+        logger.info("Keyboard typer initialized with %d mappings", len(self.word_mappings))
+        logger.info("Discard filter has %d phrases", len(self.discard_phrases))
     
     def _start_queue_worker(self):
         """Start the background worker thread that processes the output queue"""
@@ -80,27 +228,27 @@ class KeyboardTyper:
     def _queue_worker_loop(self):
         """Background worker that processes queued keyboard output tasks"""
         while self._queue_running:
-            try:
-                task = self._output_queue.get(timeout=0.5)
-            except queue.Empty:
-                continue
+            # Block until a task arrives; None is the shutdown sentinel
+            task = self._output_queue.get()
+            if task is None:
+                break
             
             try:
-                task_type = task.get("type")
+                task_type, args = task
+                handler = self._dispatch.get(task_type)
                 
-                if task_type == "type_final":
-                    self._do_type_final(task["text"], task["delay"])
+                if handler is not None:
+                    handler(*args)
                 else:
-                    logger.warning(f"Unknown queue task type: {task_type}")
+                    logger.warning("Unknown queue task type: %s", task_type)
             
             except Exception as e:
-                logger.error(f"Error processing keyboard queue task: {e}")
-            finally:
-                self._output_queue.task_done()
+                logger.error("Error processing keyboard queue task: %s", e)
     
     def stop_queue_worker(self):
         """Stop the queue worker thread (for cleanup)"""
         self._queue_running = False
+        self._output_queue.put(None)
         if self._queue_worker_thread:
             self._queue_worker_thread.join(timeout=2.0)
             self._queue_worker_thread = None
@@ -120,10 +268,10 @@ class KeyboardTyper:
             return True
         
         # Normalize: lowercase, strip whitespace and punctuation
-        normalized = re.sub(r'^[\s\.,!?;:]+|[\s\.,!?;:]+$', '', text.lower().strip())
+        normalized = _normalize_discard_text(text)
         
         if normalized in self.discard_phrases:
-            logger.info(f"Discarding text: {repr(text)} -> {repr(normalized)}")
+            logger.info("Discarding text: %r -> %r", text, normalized)
             return True
         
         return False
@@ -139,11 +287,10 @@ class KeyboardTyper:
         if not text:
             return
         
-        self._output_queue.put({
-            "type": "type_final",
-            "text": text,
-            "delay": delay if delay is not None else self.typing_delay_s
-        })
+        self._output_queue.put((
+            "type_final",
+            (text, delay if delay is not None else self.typing_delay_s)
+        ))
     
     def _do_type_final(self, text: str, delay: float):
         """
@@ -156,25 +303,73 @@ class KeyboardTyper:
         # Process text and apply word mappings
         processed_items = self._apply_word_mappings(text)
         
-        logger.debug(f"Processed items: {repr(processed_items)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processed items: %r", processed_items)
         
         try:
-            for item in processed_items:
-                if isinstance(item, dict) and 'hotkey' in item:
-                    self._execute_hotkey(item['hotkey'])
-                else:
-                    for char in item:
-                        self._type_char(char)
-                        if delay > 0:
-                            time.sleep(delay)
-            
-            # Append a space after final transcription
-            self._type_char(' ')
+            if delay <= 0 and self.key_hold_s <= 0 and self.typing_delay_s <= 0:
+                # No pacing required: type each run of text in a single call
+                self._type_batched(processed_items)
+            else:
+                for item in processed_items:
+                    if isinstance(item, dict) and 'hotkey' in item:
+                        self._execute_hotkey(item['hotkey'])
+                    else:
+                        for char in item:
+                            self._type_char(char)
+                            if delay > 0:
+                                time.sleep(delay)
+                
+                # Append a space after final transcription
+                self._type_char(' ')
             
-            logger.info(f"Typed: {repr(text)}")
+            logger.info("Typed: %r", text)
         
         except Exception as e:
-            logger.error(f"Error typing text: {e}")
+            logger.error("Error typing text: %s", e)
+    
+    def _type_batched(self, processed_items):
+        """
+        Type processed items without per-key pacing
+        
+        Consecutive text items are joined and sent with one controller.type()
+        call; hotkeys are executed in between.
+        
+        Args:
+            processed_items: Output of _apply_word_mappings
+        """
+        run = []
+        
+        for item in processed_items:
+            if isinstance(item, dict) and 'hotkey' in item:
+                if run:
+                    self._type_run(''.join(run))
+                    run = []
+                self._execute_hotkey(item['hotkey'])
+            else:
+                run.append(item)
+        
+        # Append a space after final transcription
+        run.append(' ')
+        self._type_run(''.join(run))
+    
+    def _type_run(self, text: str):
+        """
+        Type a run of text with a single controller.type() call
+        
+        pynput stops at the first character it cannot type; the rest of the
+        run is then typed per character, skipping only untypeable ones.
+        
+        Args:
+            text: Text to type
+        """
+        try:
+            self.controller.type(text)
+        except Controller.InvalidCharacterException as e:
+            # Characters before the failing index were already typed
+            index = e.args[0]
+            for char in text[index:]:
+                self._type_char(char)
     
     def _apply_word_mappings(self, text: str):
         """
@@ -190,50 +385,60 @@ class KeyboardTyper:
             return [text]
         
         # Always strip trailing period - Whisper adds them automatically
-        text = re.sub(r'\.\s*$', '', text)
+        stripped = text.rstrip()
+        if stripped.endswith('.'):
+            text = stripped[:-1]
         
-        # Sort mappings by length (longest first) to avoid partial matches
-        sorted_mappings = sorted(
-            self.word_mappings.items(),
-            key=lambda x: len(x[0]),
-            reverse=True
-        )
+        # Quick check: no mapped phrase can match if none of their first letters occur
+        if self._mapping_first_re is None or not self._mapping_first_re.search(text):
+            return [text]
         
-        # Build replacements with markers
-        replacements = {}
-        marker_counter = 0
-        result_text = text
+        # Single pass over the text: emit unmatched slices and replacements in order
+        # (whitespace-only slices are skipped; isspace() avoids strip()'s copy)
+        items = []
+        last = 0
         
-        for word, replacement in sorted_mappings:
-            pattern = rf'\b{re.escape(word)}\b[,.\s]*'
+        for match in self._mapping_re.finditer(text):
+            before = text[last:match.start()]
+            if before and not before.isspace():
+                items.append(before)
             
-            def replace_func(match, counter=marker_counter, repl=replacement):
-                nonlocal marker_counter
-                marker = f"<<<MARKER_{counter}>>>"
-                replacements[marker] = repl
-                marker_counter += 1
-                return marker
+            item = self._lookup_mapping(match.group(1))
+            if item:
+                items.append(item)
             
-            result_text = re.sub(pattern, replace_func, result_text, flags=re.IGNORECASE)
+            last = match.end()
         
-        # Split by markers and build final list
-        items = []
-        parts = re.split(r'(<<<MARKER_\d+>>>)', result_text)
-        
-        for part in parts:
-            if part.startswith('<<<MARKER_'):
-                replacement = replacements.get(part, '')
-                
-                # Check if replacement is a hotkey
-                if '+' in replacement and len(replacement) < 20:
-                    items.append({'hotkey': replacement})
-                elif replacement:
-                    items.append(replacement)
-            elif part.strip():
-                items.append(part)
+        remaining = text[last:]
+        if remaining and not remaining.isspace():
+            items.append(remaining)
         
         return items if items else [text]
     
+    def _lookup_mapping(self, phrase: str):
+        """
+        Get the output item for a phrase matched by the mapping regex
+        
+        A case-insensitive match does not always lowercase back to the stored
+        phrase (e.g. 'İ', 'ſ' or final 'ς'), so on a miss each phrase is
+        matched against the text the same way the regex did.
+        
+        Args:
+            phrase: Matched text
+            
+        Returns:
+            Replacement text or hotkey command (the phrase itself if unresolved)
+        """
+        key = phrase.lower()
+        if key in self._mapping_lookup:
+            return self._mapping_lookup[key]
+        
+        for word, item in self._mapping_lookup.items():
+            if re.fullmatch(re.escape(word), phrase, re.IGNORECASE):
+                return item
+        
+        return phrase
+    
     def _execute_hotkey(self, hotkey_str: str):
         """
         Execute a hotkey combination
@@ -242,48 +447,27 @@ class KeyboardTyper:
             hotkey_str: Hotkey string like "ctrl+z" or "ctrl+shift+s"
         """
         try:
-            keys = hotkey_str.lower().split('+')
+            pynput_keys = self._hotkey_cache.get(hotkey_str)
+            if pynput_keys is None:
+                pynput_keys = _parse_hotkey(hotkey_str)
             
-            key_map = {
-                'ctrl': Key.ctrl,
-                'control': Key.ctrl,
-                'shift': Key.shift,
-                'alt': Key.alt,
-                'cmd': Key.cmd,
-                'win': Key.cmd,
-                'super': Key.cmd,
-                'enter': Key.enter,
-                'tab': Key.tab,
-                'esc': Key.esc,
-                'escape': Key.esc,
-                'backspace': Key.backspace,
-                'delete': Key.delete,
-                'space': Key.space,
-            }
+            logger.info("Executing hotkey: %s", hotkey_str)
             
-            pynput_keys = []
-            for key in keys:
-                if key in key_map:
-                    pynput_keys.append(key_map[key])
-                else:
-                    pynput_keys.append(key)
-            
-            logger.info(f"Executing hotkey: {hotkey_str}")
-            
-            # Press all keys
+            # Press all keys, hold the combination once, then release all keys
+            # in reverse order (pynput sends the events in order)
             for key in pynput_keys:
                 self.controller.press(key)
-                time.sleep(0.01)
             
-            # Release all keys in reverse order
+            if self.hotkey_delay_s > 0:
+                time.sleep(self.hotkey_delay_s)
+            
             for key in reversed(pynput_keys):
                 self.controller.release(key)
-                time.sleep(0.01)
             
-            logger.debug(f"Hotkey executed: {hotkey_str}")
+            logger.debug("Hotkey executed: %s", hotkey_str)
         
         except Exception as e:
-            logger.error(f"Error executing hotkey {hotkey_str}: {e}")
+            logger.error("Error executing hotkey %s: %s", hotkey_str, e)
     
     def _type_char(self, char: str):
         """
@@ -310,4 +494,4 @@ class KeyboardTyper:
                 time.sleep(self.typing_delay_s)
         
         except Exception as e:
-            logger.warning(f"Could not type character {repr(char)}: {e}")
+            logger.warning("Could not type character %r: %s", char, e)
@@ -69,7 +69,7 @@ class PerceptionVoiceClient:
         header = struct.pack('>I', len(payload))
         sock.sendall(header + payload)
     
-    def _recv_exact(self, sock: socket.socket, size: int) -> Optional[bytes]:
+    def _recv_exact(self, sock: socket.socket, size: int) -> Optional[bytearray]:
         """
         Receive exactly `size` bytes from socket
         
@@ -80,12 +80,15 @@ class PerceptionVoiceClient:
         Returns:
             Received bytes, or None if connection closed
         """
-        data = b''
-        while len(data) < size:
-            chunk = sock.recv(size - len(data))
-            if not chunk:
+        # Receive directly into a preallocated buffer (no re-concatenation)
+        data = bytearray(size)
+        view = memoryview(data)
+        received = 0
+        while received < size:
+            n = sock.recv_into(view[received:])
+            if not n:
                 return None
-            data += chunk
+            received += n
         return data
     
     def _recv_message(self, sock: socket.socket) -> Optional[Dict[str, Any]]:
@@ -181,8 +184,8 @@ class PerceptionVoiceClient:
                 return []
             
             transcriptions = []
-            for line in text.strip().split('\n'):
-                if line:
+            for line in text.split('\n'):
+                if line and not line.isspace():
                     try:
                         transcriptions.append(json.loads(line))
                     except json.JSONDecodeError:
@@ -4,17 +4,28 @@ Sound playback for audio feedback
 
 import logging
 import os
+import queue
+import shutil
 import subprocess
 import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Pending sounds beyond this are dropped rather than piling up
+PLAY_QUEUE_SIZE = 16
+
+# Seconds before a stuck paplay/aplay process is killed
+PLAYER_TIMEOUT_S = 5
+
 
 class SoundPlayer:
     """Plays sound files for user feedback"""
     
+    # Player detected by the first instance, shared by later ones
+    _detected_player: Optional[str] = None
+    
     def __init__(self, enabled: bool = True, base_path: Optional[Path] = None):
         """
         Initialize sound player
@@ -25,22 +36,70 @@ class SoundPlayer:
         """
         self.enabled = enabled
         self._player = None
+        self._play_func: Optional[Callable[[str], Any]] = None
         self.base_path = base_path or Path.cwd()
         
+        # Resolved absolute path by requested filepath (None if missing)
+        self._resolved_paths: Dict[str, Optional[str]] = {}
+        
+        # Loaded sounds by filepath (pygame Sound, WAV bytes or decoded samples),
+        # loaded on first play
+        self._sounds: Dict[str, Any] = {}
+        
         # Try to find a suitable audio player
         self._detect_player()
+        
+        # Async playback is serialized through a single worker thread
+        self._play_queue: queue.Queue = queue.Queue(maxsize=PLAY_QUEUE_SIZE)
+        self._play_worker_thread: Optional[threading.Thread] = None
+        if self.enabled:
+            self._start_play_worker()
+    
+    def _start_play_worker(self):
+        """Start the background worker thread that plays queued sounds"""
+        self._play_worker_thread = threading.Thread(
+            target=self._play_worker_loop,
+            daemon=True,
+            name="SoundPlayerQueue"
+        )
+        self._play_worker_thread.start()
+        logger.debug("Sound player worker started")
+    
+    def _play_worker_loop(self):
+        """Background worker that plays queued sound files in order"""
+        while True:
+            filepath = self._play_queue.get()
+            self._play_sync(filepath)
     
     def _detect_player(self):
-        """Detect available audio player"""
+        """Detect available audio player (once per process)"""
         if not self.enabled:
             return
         
+        if SoundPlayer._detected_player:
+            self._player = SoundPlayer._detected_player
+        else:
+            self._player = self._find_player()
+            if not self._player:
+                logger.warning("No sound player available (winsound/pygame/sounddevice/paplay/aplay)")
+                self.enabled = False
+                return
+            SoundPlayer._detected_player = self._player
+        
+        self._play_func = self._bind_play_func(self._player)
+    
+    def _find_player(self) -> Optional[str]:
+        """
+        Find the first available audio player
+        
+        Returns:
+            Player name, or None if no player is available
+        """
         # Try winsound (Windows)
         try:
             import winsound
-            self._player = 'winsound'
             logger.debug("Using winsound for audio playback")
-            return
+            return 'winsound'
         except ImportError:
             pass
         
@@ -48,50 +107,28 @@ class SoundPlayer:
         try:
             import pygame
             pygame.mixer.init()
-            self._player = 'pygame'
             logger.debug("Using pygame for audio playback")
-            return
+            return 'pygame'
         except ImportError:
             pass
         
-        # Try playsound
+        # Try sounddevice + soundfile (PortAudio); sounddevice raises OSError
+        # when the PortAudio library itself is missing
         try:
-            import playsound
-            self._player = 'playsound'
-            logger.debug("Using playsound for audio playback")
-            return
-        except ImportError:
+            import sounddevice
+            import soundfile
+            logger.debug("Using sounddevice for audio playback")
+            return 'sounddevice'
+        except (ImportError, OSError):
             pass
         
         # Try paplay (PulseAudio) or aplay (ALSA) on Linux
-        try:
-            result = subprocess.run(
-                ['which', 'paplay'],
-                capture_output=True,
-                timeout=1
-            )
-            if result.returncode == 0:
-                self._player = 'paplay'
-                logger.debug("Using paplay for audio playback")
-                return
-        except Exception:
-            pass
+        for player in ('paplay', 'aplay'):
+            if shutil.which(player):
+                logger.debug("Using %s for audio playback", player)
+                return player
         
-        try:
-            result = subprocess.run(
-                ['which', 'aplay'],
-                capture_output=True,
-                timeout=1
-            )
-            if result.returncode == 0:
-                self._player = 'aplay'
-                logger.debug("Using aplay for audio playback")
-                return
-        except Exception:
-            pass
-        
-        logger.warning("No sound player available (winsound/pygame/playsound/paplay/aplay)")
-        self.enabled = False
+        return None
     
     def play(self, filepath: str, async_play: bool = True):
         """
@@ -104,65 +141,114 @@ class SoundPlayer:
         if not self.enabled or not self._player:
             return
         
+        if filepath in self._resolved_paths:
+            resolved = self._resolved_paths[filepath]
+        else:
+            resolved = self._resolved_paths[filepath] = self._resolve_path(filepath)
+        
+        if resolved is None:
+            return
+        filepath = resolved
+        
+        if async_play:
+            # Hand off to the worker thread to avoid blocking
+            try:
+                self._play_queue.put_nowait(filepath)
+            except queue.Full:
+                logger.debug("Sound queue full, dropping: %s", filepath)
+        else:
+            self._play_sync(filepath)
+    
+    def _resolve_path(self, filepath: str) -> Optional[str]:
+        """
+        Resolve a sound file path and check that it exists
+        
+        Args:
+            filepath: Path to the sound file (can be relative or absolute)
+            
+        Returns:
+            Absolute path as a string, or None if the file does not exist
+        """
         # Resolve path: if relative, resolve relative to base_path
         filepath_obj = Path(filepath)
         if not filepath_obj.is_absolute():
             filepath_obj = self.base_path / filepath_obj
         
-        filepath = str(filepath_obj)
+        resolved = str(filepath_obj)
         
         # Check if file exists
-        if not os.path.exists(filepath):
-            logger.debug(f"Sound file not found: {filepath} (skipping)")
-            return
+        if not os.path.exists(resolved):
+            logger.debug("Sound file not found: %s (skipping)", resolved)
+            return None
         
-        if async_play:
-            # Play in background thread to avoid blocking
-            thread = threading.Thread(
-                target=self._play_sync,
-                args=(filepath,),
-                daemon=True
-            )
-            thread.start()
-        else:
-            self._play_sync(filepath)
+        return resolved
     
-    def _play_sync(self, filepath: str):
+    def _bind_play_func(self, player: str) -> Callable[[str], Any]:
         """
-        Play sound synchronously
+        Import the player backend once and bind its playback function
         
         Args:
-            filepath: Path to the sound file
+            player: Player name from _find_player
+            
+        Returns:
+            Function that plays a sound file synchronously
         """
-        try:
-            if self._player == 'winsound':
-                import winsound
-                winsound.PlaySound(filepath, winsound.SND_FILENAME)
+        if player == 'winsound':
+            import winsound
             
-            elif self._player == 'pygame':
-                import pygame
-                sound = pygame.mixer.Sound(filepath)
-                sound.play()
+            def play_winsound(filepath: str):
+                data = self._sounds.get(filepath)
+                if data is None:
+                    with open(filepath, 'rb') as f:
+                        data = self._sounds[filepath] = f.read()
+                winsound.PlaySound(data, winsound.SND_MEMORY | winsound.SND_NODEFAULT)
+            
+            return play_winsound
+        
+        if player == 'pygame':
+            import pygame
             
-            elif self._player == 'playsound':
-                from playsound import playsound
-                playsound(filepath)
+            def play_pygame(filepath: str):
+                sound = self._sounds.get(filepath)
+                if sound is None:
+                    sound = self._sounds[filepath] = pygame.mixer.Sound(filepath)
+                sound.play()
             
-            elif self._player == 'paplay':
-                subprocess.run(
-                    ['paplay', filepath],
-                    capture_output=True,
-                    timeout=5
-                )
+            return play_pygame
+        
+        if player == 'sounddevice':
+            import sounddevice
+            import soundfile
             
-            elif self._player == 'aplay':
-                subprocess.run(
-                    ['aplay', '-q', filepath],
-                    capture_output=True,
-                    timeout=5
-                )
+            def play_sounddevice(filepath: str):
+                sound = self._sounds.get(filepath)
+                if sound is None:
+                    sound = self._sounds[filepath] = soundfile.read(filepath, dtype='int16')
+                data, samplerate = sound
+                sounddevice.play(data, samplerate, blocking=True)
             
-            logger.debug(f"Played sound: {filepath}")
+            return play_sounddevice
+        
+        # paplay (PulseAudio) or aplay (ALSA); output is discarded, and the
+        # timeout keeps a hung player from blocking the worker for good
+        command = ['paplay'] if player == 'paplay' else ['aplay', '-q']
+        return lambda filepath: subprocess.run(
+            command + [filepath],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=PLAYER_TIMEOUT_S
+        )
+    
+    def _play_sync(self, filepath: str):
+        """
+        Play sound synchronously
+        
+        Args:
+            filepath: Path to the sound file
+        """
+        try:
+            self._play_func(filepath)
+            logger.debug("Played sound: %s", filepath)
         
         except Exception as e:
-            logger.error(f"Error playing sound {filepath}: {e}")
+            logger.error("Error playing sound %s: %s", filepath, e)
@@ -6,11 +6,9 @@ and types them to the active window via keyboard simulation.
 """
 
 import logging
-import signal
 import sys
 import threading
 import time
-from pathlib import Path
 
 from whisper.config import Config
 from whisper.keyboard_output import KeyboardTyper
@@ -37,8 +35,11 @@ class VoiceKeyboard:
         self.is_running = False
         self.is_listening = False
         
-        # Timestamp tracking for logging
-        self.start_time = time.time()
+        # Timestamp tracking for logging (monotonic, immune to clock steps)
+        self.start_time = time.monotonic()
+        
+        # Signaled by quit() to wake the main loop
+        self._quit_event = threading.Event()
         
         # Statistics
         self.transcription_count = 0
@@ -61,7 +62,9 @@ class VoiceKeyboard:
             word_mappings=config.word_mappings,
             typing_delay_ms=config.typing_delay_ms,
             key_hold_ms=config.key_hold_ms,
-            discard_phrases=config.discard_phrases
+            hotkey_delay_ms=config.hotkey_delay_ms,
+            discard_phrases=config.discard_phrases,
+            fast_mode=config.fast_mode
         )
         
         # Setup hotkey listener
@@ -90,7 +93,7 @@ class VoiceKeyboard:
     def log(self, message: str):
         """Log message with optional timestamp"""
         if self.config.timestamps_enabled:
-            elapsed = time.time() - self.start_time
+            elapsed = time.monotonic() - self.start_time
             seconds = int(elapsed)
             milliseconds = int((elapsed - seconds) * 1000)
             timestamp = f"{seconds}.{milliseconds:03d}s "
@@ -226,10 +229,10 @@ class VoiceKeyboard:
         else:
             self.log("🎙️  Ready! (Ctrl+C to quit)")
         
-        # Keep running
+        # Keep running until quit() signals the event
         try:
             while self.is_running:
-                time.sleep(0.1)
+                self._quit_event.wait(1.0)
         except KeyboardInterrupt:
             self.log("\n⏹️  Stopping...")
             self.quit()
@@ -240,6 +243,7 @@ class VoiceKeyboard:
         """Stop the voice keyboard"""
         self.is_running = False
         self.is_listening = False
+        self._quit_event.set()
         
         # Stop polling
         self._stop_polling()